@@ -0,0 +1,22 @@
+"""t3rm1n4l entry point."""
+
+import threading
+
+
+def main():
+    from src.ui.splash import show_splash_screen
+
+    # Let the splash animation run while the app (and everything it pulls
+    # in) imports; nothing else is imported eagerly up front.
+    splash = threading.Thread(target=show_splash_screen, args=(3,), daemon=True)
+    splash.start()
+
+    from src.ui.app import TerminalApp
+
+    app = TerminalApp()
+    splash.join(timeout=3)
+    app.run()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,24 @@
+from setuptools import setup, find_packages
+
+setup(
+    name="t3rm1n4l",
+    version="0.1.0",
+    description="Play music from the terminal",
+    packages=find_packages(),
+    py_modules=["main"],
+    python_requires=">=3.10",
+    install_requires=[
+        "rich",
+        "pygame",
+        "mutagen",
+        "tinytag",
+    ],
+    extras_require={
+        "fast": ["orjson"],
+    },
+    entry_points={
+        "console_scripts": [
+            "t3rm1n4l=main:main",
+        ],
+    },
+)
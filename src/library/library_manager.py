@@ -0,0 +1,431 @@
+"""Music library management: the track index and playlists."""
+
+import atexit
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+
+try:
+    from tinytag import TinyTag
+except ImportError:  # metadata extraction degrades to filename parsing
+    TinyTag = None
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to stdlib json
+    orjson = None
+    import json
+
+from src.utils.helpers import (
+    extract_track_info_from_filename,
+    find_music_directory,
+    format_duration,
+    iter_music_files,
+)
+
+# Supported audio file suffixes (lowercase, no dot).
+_EXTS = frozenset(("mp3", "wav", "ogg", "flac"))
+_EXT_SUFFIXES = tuple("." + e for e in _EXTS)
+
+
+def _extract_meta(path):
+    """Extract (path, title, artist, album, duration) for one file.
+
+    Module-level so ProcessPoolExecutor can pickle it to worker processes.
+    tinytag only reads the header/first frame, which is far cheaper than a
+    full mutagen parse; the player still uses mutagen for APIC/ID3 detail
+    on the currently playing track.
+    """
+    title = artist = album = None
+    duration = 0.0
+    if TinyTag is not None:
+        try:
+            tag = TinyTag.get(path)
+            title = tag.title or None
+            artist = tag.artist or None
+            album = tag.album or None
+            duration = tag.duration or 0.0
+        except Exception:
+            pass
+    if not title or not artist:
+        info = extract_track_info_from_filename(os.path.basename(path))
+        title = title or info["title"]
+        artist = artist or info["artist"]
+    return path, title, artist, album, duration
+
+
+@dataclass
+class Track:
+    """A single track in the library."""
+
+    path: str
+    title: str
+    artist: str = "Unknown Artist"
+    album: str = "Unknown Album"
+    duration: float = 0.0
+    mtime: float = 0.0
+    formatted_duration: str = ""
+    # Derived attributes; leading underscores keep them out of the
+    # serialized form.
+    _blob: str = field(init=False, repr=False, compare=False, default="")
+    _basename: str = field(init=False, repr=False, compare=False, default="")
+
+    def __post_init__(self):
+        if not self.formatted_duration:
+            self.formatted_duration = format_duration(self.duration)
+        self._blob = f"{self.title}\n{self.artist}\n{self.album}".casefold()
+        self._basename = os.path.basename(self.path)
+
+
+@dataclass
+class Playlist:
+    """A named, ordered list of track paths.
+
+    The list keeps play order; a shadow set makes membership tests and
+    dedup O(1) instead of a linear scan per edit.
+    """
+
+    name: str
+    tracks: list = field(default_factory=list)
+    _track_set: set = field(init=False, repr=False, compare=False, default_factory=set)
+
+    def __post_init__(self):
+        self._track_set = set(self.tracks)
+
+    def __contains__(self, path):
+        return path in self._track_set
+
+    def add(self, path):
+        """Append `path` unless already present. Returns True if added."""
+        if path in self._track_set:
+            return False
+        self.tracks.append(path)
+        self._track_set.add(path)
+        return True
+
+    def remove(self, path):
+        """Remove `path` if present. Returns True if removed."""
+        if path not in self._track_set:
+            return False
+        self._track_set.discard(path)
+        self.tracks.remove(path)
+        return True
+
+
+def _public_dict(obj):
+    """Dict view of a dataclass without private (underscore) fields."""
+    return {k: v for k, v in obj.__dict__.items() if not k.startswith("_")}
+
+
+class LibraryManager:
+    """Owns the on-disk track index and the user's playlists."""
+
+    def __init__(self, library_path=None, data_dir="data"):
+        self.library_path = library_path or find_music_directory()
+        self.data_dir = data_dir
+        self.library_file = os.path.join(data_dir, "library.json")
+        self.playlists_dir = os.path.join(data_dir, "playlists")
+        self.tracks = {}  # path -> Track
+        self.playlists = {}  # name -> Playlist
+        self.version = 0  # bumped whenever the track set changes
+        self._by_artist = {}  # artist -> list[Track]
+        self._by_album = {}  # album -> list[Track]
+        self._artists_sorted = []
+        self._all_sorted = []
+        self._sorted_version = -1  # self.version the sorted views match
+        self._save_timer = None
+        self._save_lock = threading.Lock()
+        os.makedirs(self.playlists_dir, exist_ok=True)
+        self.load_library()
+        self.load_playlists()
+        atexit.register(self.flush)
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def load_library(self):
+        """Load the track index from disk, if present."""
+        if not os.path.exists(self.library_file):
+            return
+        try:
+            with open(self.library_file, "rb") as f:
+                raw = f.read()
+            data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        except (ValueError, OSError):
+            return
+        for entry in data.get("tracks", []):
+            track = Track(**entry)
+            self.tracks[track.path] = track
+            self._index_track(track)
+        self.version += 1
+
+    def save_library(self):
+        """Schedule a debounced write of the track index.
+
+        Rapid successive edits collapse into a single write 500 ms after
+        the last call; flush() (also registered atexit) forces it early.
+        """
+        with self._save_lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+            self._save_timer = threading.Timer(0.5, self._flush_library)
+            self._save_timer.daemon = True
+            self._save_timer.start()
+
+    def flush(self):
+        """Write any pending library save immediately."""
+        with self._save_lock:
+            if self._save_timer is None:
+                return
+            self._save_timer.cancel()
+        self._flush_library()
+
+    def _flush_library(self):
+        with self._save_lock:
+            self._save_timer = None
+        payload = {"tracks": list(self.tracks.values())}
+        tmp = self.library_file + ".tmp"
+        with open(tmp, "wb") as f:
+            if orjson is not None:
+                f.write(
+                    orjson.dumps(
+                        payload,
+                        option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_DATACLASS,
+                    )
+                )
+            else:
+                payload = {"tracks": [_public_dict(t) for t in self.tracks.values()]}
+                f.write(json.dumps(payload, indent=2).encode())
+        os.replace(tmp, self.library_file)
+
+    def load_playlists(self):
+        """Load every playlist file from the playlists directory."""
+        if not os.path.isdir(self.playlists_dir):
+            return
+        for filename in os.listdir(self.playlists_dir):
+            if not filename.endswith(".json"):
+                continue
+            try:
+                with open(os.path.join(self.playlists_dir, filename), "rb") as f:
+                    raw = f.read()
+                data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+            except (ValueError, OSError):
+                continue
+            playlist = Playlist(name=data["name"], tracks=data.get("tracks", []))
+            self.playlists[playlist.name] = playlist
+
+    def save_playlists(self):
+        """Write every playlist to its own file."""
+        for name in self.playlists:
+            self._save_playlist(name)
+
+    def _save_playlist(self, name):
+        """Atomically rewrite the one playlist file that changed."""
+        playlist = self.playlists[name]
+        final = os.path.join(self.playlists_dir, f"{name}.json")
+        tmp = final + ".tmp"
+        with open(tmp, "wb") as f:
+            if orjson is not None:
+                f.write(
+                    orjson.dumps(
+                        playlist,
+                        option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_DATACLASS,
+                    )
+                )
+            else:
+                f.write(json.dumps(_public_dict(playlist), indent=2).encode())
+        os.replace(tmp, final)
+
+    # ------------------------------------------------------------------
+    # Scanning
+    # ------------------------------------------------------------------
+
+    def scan_library(self):
+        """Walk the music directory and index every supported audio file.
+
+        Uses an iterative os.scandir walk: scandir caches the dirent type
+        from getdents, so is_dir/is_file need no extra stat per entry.
+        """
+        if not os.path.isdir(self.library_path):
+            return 0
+        # path -> mtime, both from the same dirent read.
+        found_tracks = dict(
+            iter_music_files(self.library_path, exts=_EXT_SUFFIXES)
+        )
+        # Only hand add_tracks the delta: paths that are new or whose
+        # mtime changed since they were indexed. The files were observed
+        # by the walk just now, so no existence re-check is needed either.
+        new_paths = {
+            p: mt
+            for p, mt in found_tracks.items()
+            if (t := self.tracks.get(p)) is None or t.mtime != mt
+        }
+        if new_paths:
+            self.add_tracks(new_paths, mtimes=new_paths)
+        return len(found_tracks)
+
+    def add_tracks(self, paths, mtimes=None):
+        """Extract metadata for the given files and add them to the index.
+
+        Files whose path and mtime already match an indexed Track are
+        skipped entirely, so a rescan of an unchanged library does no
+        metadata parsing. Parsing for the rest is fanned out to a process
+        pool: each probe reads and decodes the file header, which is
+        I/O-bound with enough CPU that processes beat threads under the
+        GIL.
+        """
+        fresh = {}
+        for path in paths:
+            mtime = mtimes.get(path) if mtimes is not None else None
+            if mtime is None:
+                try:
+                    mtime = os.stat(path).st_mtime
+                except OSError:
+                    continue
+            existing = self.tracks.get(path)
+            if existing is not None and existing.mtime == mtime:
+                continue
+            fresh[path] = mtime
+        if not fresh:
+            return
+        if len(fresh) > 1:
+            with ProcessPoolExecutor(max_workers=os.cpu_count()) as ex:
+                results = list(ex.map(_extract_meta, fresh, chunksize=32))
+        else:
+            results = [_extract_meta(next(iter(fresh)))]
+        for path, title, artist, album, duration in results:
+            existing = self.tracks.get(path)
+            if existing is not None:
+                self._unindex_track(existing)
+            track = Track(
+                path=path,
+                title=title,
+                artist=artist,
+                album=album or "Unknown Album",
+                duration=duration,
+                mtime=fresh[path],
+            )
+            self.tracks[path] = track
+            self._index_track(track)
+        self.version += 1
+        self.save_library()
+
+    # ------------------------------------------------------------------
+    # Inverted indexes
+    # ------------------------------------------------------------------
+
+    def _index_track(self, track):
+        self._by_artist.setdefault(track.artist, []).append(track)
+        self._by_album.setdefault(track.album, []).append(track)
+
+    def _unindex_track(self, track):
+        for index, key in ((self._by_artist, track.artist), (self._by_album, track.album)):
+            bucket = index.get(key)
+            if bucket is None:
+                continue
+            try:
+                bucket.remove(track)
+            except ValueError:
+                pass
+            if not bucket:
+                del index[key]
+
+    # ------------------------------------------------------------------
+    # Playlists
+    # ------------------------------------------------------------------
+
+    def create_playlist(self, name):
+        if name in self.playlists:
+            return False
+        self.playlists[name] = Playlist(name=name)
+        self._save_playlist(name)
+        return True
+
+    def delete_playlist(self, name):
+        if name not in self.playlists:
+            return False
+        del self.playlists[name]
+        path = os.path.join(self.playlists_dir, f"{name}.json")
+        if os.path.exists(path):
+            os.remove(path)
+        return True
+
+    def add_to_playlist(self, name, path):
+        if name not in self.playlists or path not in self.tracks:
+            return False
+        if not self.playlists[name].add(path):
+            return False
+        self._save_playlist(name)
+        return True
+
+    def remove_from_playlist(self, name, path):
+        if name not in self.playlists:
+            return False
+        if not self.playlists[name].remove(path):
+            return False
+        self._save_playlist(name)
+        return True
+
+    def get_playlist_tracks(self, name):
+        """Resolve a playlist's paths to Track objects, skipping stale entries."""
+        playlist = self.playlists.get(name)
+        if playlist is None:
+            return []
+        return [t for p in playlist.tracks if (t := self.tracks.get(p)) is not None]
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def get_all_tracks(self):
+        return list(self.tracks.values())
+
+    def _refresh_sorted(self):
+        """Rebuild the sorted views once per library version."""
+        if self._sorted_version == self.version:
+            return
+        self._artists_sorted = sorted(self._by_artist)
+        for bucket in self._by_artist.values():
+            bucket.sort(key=lambda t: t.title)
+        self._all_sorted = sorted(self.tracks.values(), key=lambda t: t.title)
+        self._sorted_version = self.version
+
+    def get_artists(self):
+        """Sorted artist names; recomputed only when the library changes."""
+        self._refresh_sorted()
+        return self._artists_sorted
+
+    def get_tracks_for_artist(self, artist):
+        """Tracks for one artist, pre-sorted by title."""
+        self._refresh_sorted()
+        return self._by_artist.get(artist, [])
+
+    def get_all_sorted(self):
+        """Every track, pre-sorted by title."""
+        self._refresh_sorted()
+        return self._all_sorted
+
+    def get_tracks_by_artist(self, artist):
+        return list(self._by_artist.get(artist, ()))
+
+    def get_tracks_by_album(self, album):
+        return list(self._by_album.get(album, ()))
+
+    def search(self, query):
+        """Case-insensitive substring search over title/artist/album."""
+        query = query.casefold()
+        return [t for t in self.tracks.values() if query in t._blob]
+
+    def remove_track(self, path):
+        if path not in self.tracks:
+            return False
+        self._unindex_track(self.tracks[path])
+        del self.tracks[path]
+        self.version += 1
+        for playlist in self.playlists.values():
+            if playlist.remove(path):
+                self._save_playlist(playlist.name)
+        self.save_library()
+        return True
@@ -0,0 +1,403 @@
+"""Audio playback built on pygame's mixer.
+
+Heavy third-party modules (pygame, mutagen, rich renderables) are imported
+lazily through the module-level __getattr__ below, so importing this module
+costs almost nothing and the UI can paint before any of them load.
+"""
+
+import hashlib
+import os
+import sys
+import threading
+import time
+
+from src.utils.helpers import find_music_directory, format_duration
+
+_PYGAME_OK = None  # None = not tried yet
+
+
+def __getattr__(name):
+    """Lazily import and cache the heavy dependencies on first use."""
+    if name == "pygame":
+        import pygame as mod
+    elif name == "MP3":
+        from mutagen.mp3 import MP3 as mod
+    elif name == "ID3":
+        from mutagen.id3 import ID3 as mod
+    elif name == "ID3NoHeaderError":
+        from mutagen.id3 import ID3NoHeaderError as mod
+    elif name == "Panel":
+        from rich.panel import Panel as mod
+    elif name == "Text":
+        from rich.text import Text as mod
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = mod
+    return mod
+
+
+def _lazy(name):
+    """Resolve one of the lazy attributes from inside this module."""
+    return getattr(sys.modules[__name__], name)
+
+
+def _safe_id3(path):
+    """ID3 tags for `path`, or None when the file has no tag header."""
+    try:
+        return _lazy("ID3")(path)
+    except Exception:
+        return None
+
+
+def _ensure_pygame():
+    """Initialize the pygame mixer once; remember whether it worked."""
+    global _PYGAME_OK
+    if _PYGAME_OK is None:
+        try:
+            # The dummy video driver gives us an event queue (for the
+            # end-of-track event) without needing a real display.
+            os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+            pygame = _lazy("pygame")
+            pygame.mixer.init()
+            try:
+                pygame.display.init()
+            except Exception:
+                pass
+            _PYGAME_OK = True
+        except Exception:
+            _PYGAME_OK = False
+    return _PYGAME_OK
+
+
+class AudioPlayer:
+    """Plays tracks through pygame.mixer.music and tracks playlist state."""
+
+    def __init__(self, library=None):
+        self.library = library  # shared LibraryManager, if the app has one
+        self.current_track = None
+        self.duration = 0.0
+        self.volume = 0.7
+        self.is_playing = False
+        self.is_paused = False
+        self.playlist = []
+        self.current_playlist_index = 0
+        self._position = 0.0  # last known position while not playing
+        self._play_offset = 0.0  # track offset playback started from
+        self._end_watcher = None
+        self._mp3_cache = {}  # path -> (MP3, ID3 | None)
+        self._meta_dict_cache = {}  # path -> metadata dict
+        self._art_cache = {}  # track path -> extracted art file path
+        self._artcache_dir = os.path.join("data", "artcache")
+        self._np_static = None  # cached header Text for now_playing_info
+
+    @property
+    def position(self):
+        """Current position in seconds, read from the mixer on demand."""
+        if self.is_playing and not self.is_paused and _PYGAME_OK:
+            pos_ms = _lazy("pygame").mixer.music.get_pos()
+            if pos_ms >= 0:
+                return self._play_offset + pos_ms / 1000.0
+        return self._position
+
+    @position.setter
+    def position(self, value):
+        self._position = value
+
+    # ------------------------------------------------------------------
+    # Metadata cache
+    # ------------------------------------------------------------------
+
+    def _get_mp3(self, path):
+        """Parsed (MP3, ID3) pair for `path`, parsing at most once per track."""
+        cached = self._mp3_cache.get(path)
+        if cached is None:
+            cached = (_lazy("MP3")(path), _safe_id3(path))
+            self._mp3_cache[path] = cached
+        return cached
+
+    def invalidate_metadata(self, path=None):
+        """Drop cached parses, e.g. after a track is removed or retagged."""
+        if path is None:
+            self._mp3_cache.clear()
+            self._meta_dict_cache.clear()
+            self._art_cache.clear()
+        else:
+            self._mp3_cache.pop(path, None)
+            self._meta_dict_cache.pop(path, None)
+            self._art_cache.pop(path, None)
+
+    # ------------------------------------------------------------------
+    # Playback control
+    # ------------------------------------------------------------------
+
+    def load(self, track_path):
+        """Load a track and read its duration. Returns True on success."""
+        if not _ensure_pygame() or not os.path.exists(track_path):
+            return False
+        pygame = _lazy("pygame")
+        try:
+            pygame.mixer.music.load(track_path)
+        except Exception:
+            return False
+        # Duration is display-only: a failed read must not fail the load
+        # (the MP3 parse raises on wav/ogg/flac, which the mixer plays fine).
+        self.duration = self._read_duration(track_path)
+        self.current_track = track_path
+        self.position = 0.0
+        self._np_static = None
+        return True
+
+    def _read_duration(self, track_path):
+        """Best-effort duration in seconds, 0.0 when nothing can tell us."""
+        try:
+            audio, _tags = self._get_mp3(track_path)
+            return audio.info.length
+        except Exception:
+            pass
+        if self.library is not None:
+            track = self.library.tracks.get(track_path)
+            if track is not None and track.duration:
+                return track.duration
+        try:
+            from tinytag import TinyTag
+
+            return TinyTag.get(track_path).duration or 0.0
+        except Exception:
+            return 0.0
+
+    def play(self):
+        if not _ensure_pygame() or not self.current_track:
+            return
+        pygame = _lazy("pygame")
+        if self.is_paused:
+            pygame.mixer.music.unpause()
+            self.is_paused = False
+        else:
+            pygame.mixer.music.set_volume(self.volume)
+            pygame.mixer.music.set_endevent(pygame.USEREVENT + 1)
+            pygame.mixer.music.play()
+            self._play_offset = 0.0
+        self.is_playing = True
+        if self._end_watcher is None:
+            self._end_watcher = threading.Thread(
+                target=self._watch_end, daemon=True
+            )
+            self._end_watcher.start()
+
+    def pause(self):
+        if not self.is_playing or self.is_paused:
+            return
+        self._position = self.position  # freeze the clock while paused
+        _lazy("pygame").mixer.music.pause()
+        self.is_paused = True
+
+    def toggle_play_pause(self):
+        if not self.is_playing:
+            self.play()
+        elif self.is_paused:
+            self.play()
+        else:
+            self.pause()
+
+    def stop(self):
+        # Clear the flags before halting: mixer.music.stop() posts the
+        # configured end event, and _watch_end must see is_playing False
+        # or it would advance to the next track right after a stop.
+        self.is_playing = False
+        self.is_paused = False
+        self.position = 0.0
+        if _PYGAME_OK:
+            _lazy("pygame").mixer.music.stop()
+
+    def set_volume(self, volume):
+        self.volume = max(0.0, min(1.0, volume))
+        if _PYGAME_OK:
+            _lazy("pygame").mixer.music.set_volume(self.volume)
+
+    def volume_up(self):
+        self.set_volume(self.volume + 0.1)
+
+    def volume_down(self):
+        self.set_volume(self.volume - 0.1)
+
+    # ------------------------------------------------------------------
+    # Playlist handling
+    # ------------------------------------------------------------------
+
+    def set_playlist(self, tracks, start_index=0):
+        self.playlist = list(tracks)
+        self.current_playlist_index = start_index
+        self._np_static = None  # "Track x of y" depends on the playlist
+
+    def load_from_directory(self, music_dir=None):
+        """Build a playlist from the shared library index.
+
+        Falls back to a directory walk only when no LibraryManager was
+        injected, so the usual path reuses the scan the library already did.
+        """
+        if self.library is not None:
+            files = sorted(t.path for t in self.library.get_all_tracks())
+        else:
+            from pathlib import Path
+
+            music_dir = music_dir or find_music_directory()
+            files = sorted(str(p) for p in Path(music_dir).rglob("*.mp3"))
+        self.set_playlist(files)
+        return len(files)
+
+    def _advance(self, step):
+        """Step through the playlist until a track loads; at most one lap."""
+        n = len(self.playlist)
+        if not n:
+            return False
+        for _ in range(n):
+            self.current_playlist_index = (self.current_playlist_index + step) % n
+            if self.load(self.playlist[self.current_playlist_index]):
+                self.play()
+                return True
+        return False
+
+    def next_track(self):
+        return self._advance(1)
+
+    def previous_track(self):
+        return self._advance(-1)
+
+    def _watch_end(self):
+        """Block on the SDL event queue and advance when a track finishes.
+
+        set_endevent posts USEREVENT+1 exactly once per finished track, so
+        this thread sleeps in the kernel instead of polling get_busy().
+        """
+        pygame = _lazy("pygame")
+        end_event = pygame.USEREVENT + 1
+        while True:
+            try:
+                event = pygame.event.wait(500)
+            except Exception:
+                time.sleep(0.5)
+                continue
+            if (
+                event.type == end_event
+                and self.is_playing
+                and not self.is_paused
+            ):
+                self.next_track()
+
+    # ------------------------------------------------------------------
+    # Track info
+    # ------------------------------------------------------------------
+
+    def get_progress_percentage(self):
+        if not self.duration:
+            return 0.0
+        return min(100.0, self.position / self.duration * 100.0)
+
+    def get_formatted_position(self):
+        return f"{format_duration(self.position)} / {format_duration(self.duration)}"
+
+    def get_track_metadata(self):
+        """Read title/artist/album tags for the current track (cached)."""
+        if not self.current_track:
+            return {}
+        meta = self._meta_dict_cache.get(self.current_track)
+        if meta is not None:
+            return meta
+        meta = {
+            "title": os.path.basename(self.current_track),
+            "artist": "Unknown Artist",
+            "album": "Unknown Album",
+            "duration": self.duration,
+        }
+        try:
+            audio, tags = self._get_mp3(self.current_track)
+            meta["duration"] = audio.info.length
+            if tags is not None:
+                if tags.get("TIT2"):
+                    meta["title"] = str(tags["TIT2"])
+                if tags.get("TPE1"):
+                    meta["artist"] = str(tags["TPE1"])
+                if tags.get("TALB"):
+                    meta["album"] = str(tags["TALB"])
+        except Exception:
+            pass
+        self._meta_dict_cache[self.current_track] = meta
+        return meta
+
+    def get_album_art(self):
+        """Extract embedded album art to the on-disk art cache.
+
+        Art blobs are content-addressed by blake2b hash under
+        data/artcache/, so each unique image is written exactly once per
+        session and repeat calls return the cached path immediately.
+        """
+        if not self.current_track:
+            return None
+        cached = self._art_cache.get(self.current_track)
+        if cached is not None:
+            return cached
+        try:
+            _audio, tags = self._get_mp3(self.current_track)
+        except Exception:
+            return None
+        if tags is None:
+            return None
+        for key in tags.keys():
+            if key.startswith("APIC"):
+                apic = tags[key]
+                ext = "png" if "png" in apic.mime else "jpg"
+                digest = hashlib.blake2b(apic.data, digest_size=16).hexdigest()
+                final = os.path.join(self._artcache_dir, f"{digest}.{ext}")
+                if not os.path.exists(final):
+                    os.makedirs(self._artcache_dir, exist_ok=True)
+                    try:
+                        # O_EXCL makes the create atomic: whichever caller
+                        # wins writes the blob, any loser just reuses it.
+                        fd = os.open(
+                            final, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644
+                        )
+                        try:
+                            os.write(fd, apic.data)
+                        finally:
+                            os.close(fd)
+                    except FileExistsError:
+                        pass
+                self._art_cache[self.current_track] = final
+                return final
+        return None
+
+    def now_playing_info(self):
+        """Rich panel describing the current track and player state.
+
+        The header (title/artist/album/track position) only changes when a
+        different track loads, so it is built once and cached; each call
+        only formats the three dynamic status lines.
+        """
+        Text = _lazy("Text")
+        Panel = _lazy("Panel")
+        if not self.current_track:
+            return Panel(
+                Text("Nothing playing", style="dim"),
+                title="Now Playing",
+                border_style="green",
+            )
+        if self._np_static is None:
+            meta = self.get_track_metadata()
+            static = Text()
+            static.append(f"{meta.get('title', '')}\n", style="bold cyan")
+            static.append(f"by {meta.get('artist', '')}\n", style="magenta")
+            static.append(f"on {meta.get('album', '')}\n", style="dim")
+            if self.playlist:
+                static.append(
+                    f"Track {self.current_playlist_index + 1} of {len(self.playlist)}\n",
+                    style="dim",
+                )
+            self._np_static = static
+        status = "Paused" if self.is_paused else (
+            "Playing" if self.is_playing else "Stopped"
+        )
+        dyn = Text()
+        dyn.append(f"Status: {status}\n")
+        dyn.append(f"Position: {self.get_formatted_position()}\n")
+        dyn.append(f"Volume: {int(self.volume * 100)}%")
+        return Panel(self._np_static + dyn, title="Now Playing", border_style="green")
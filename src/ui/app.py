@@ -0,0 +1,303 @@
+"""The main terminal application: layout, input loop and key handling."""
+
+import os
+import selectors
+import sys
+import termios
+import time
+import tty
+
+from rich.console import Console
+from rich.layout import Layout
+from rich.live import Live
+from rich.panel import Panel
+from rich.text import Text
+
+from src.library.library_manager import LibraryManager
+from src.player.player import AudioPlayer
+from src.ui.components import ArtistView, DetailsView, PlayerControls, SongView
+
+# Key codes as delivered by a raw terminal.
+KEY_QUIT = ord("q")
+KEY_SPACE = ord(" ")
+KEY_NEXT = ord("n")
+KEY_PREV = ord("b")
+KEY_TAB = 9
+# cbreak mode leaves ICRNL set, so Enter normally arrives as '\n' (10);
+# accept a raw '\r' (13) too in case the translation is off.
+KEY_ENTER = 10
+KEY_ENTER_CR = 13
+KEY_VOL_UP = ord("+")
+KEY_VOL_DOWN = ord("-")
+# Arrow keys arrive as ESC [ A..D; the parser maps them onto dedicated
+# codes above the byte range so they can't collide with plain letters.
+KEY_UP = 0x100 + ord("A")
+KEY_DOWN = 0x100 + ord("B")
+KEY_RIGHT = 0x100 + ord("C")
+KEY_LEFT = 0x100 + ord("D")
+
+
+def _parse_keys(data):
+    """Yield key codes from a drained stdin buffer.
+
+    Recognizes CSI arrow sequences (ESC [ A..D) as single keys; every
+    other byte passes through unchanged.
+    """
+    i, n = 0, len(data)
+    while i < n:
+        b = data[i]
+        if (
+            b == 0x1B
+            and i + 2 < n
+            and data[i + 1] == 0x5B  # '['
+            and 0x41 <= data[i + 2] <= 0x44  # 'A'..'D'
+        ):
+            yield 0x100 + data[i + 2]
+            i += 3
+        else:
+            yield b
+            i += 1
+
+
+class TerminalApp:
+    """Owns the library, the player and the render loop."""
+
+    def __init__(self):
+        self.console = Console(width=120, height=36)
+        self.library = LibraryManager()
+        self.library.scan_library()
+        self.player = AudioPlayer(library=self.library)
+        # Body height: 36-row console minus the 3-row header and footer.
+        # The three body panels split the fixed 120 columns evenly.
+        body_height = self.console.height - 6
+        pane_width = self.console.width // 3
+        self.artist_view = ArtistView(
+            self.library, height=body_height, width=pane_width
+        )
+        self.song_view = SongView(
+            self.library, self.player, height=body_height, width=pane_width
+        )
+        self.details_view = DetailsView(self.player)
+        self.controls = PlayerControls(self.player)
+        self.active_pane = "artists"  # or "songs"
+        self.status_message = "Ready"
+        self.running = False
+        self._dirty = True  # something changed since the last render
+        self._last_progress = -1  # last whole-percent progress rendered
+        self._last_second = -1  # last whole-second position rendered
+        self.layout = self.setup_ui()
+        # Anchor the artist selection first: selected_artist is None until
+        # update_artists() runs, and the song pane must show that artist.
+        self.artist_view.update_artists()
+        self.song_view.update_songs(self.artist_view.selected_artist)
+
+    def setup_ui(self):
+        layout = Layout()
+        layout.split_column(
+            Layout(name="header", size=3),
+            Layout(name="body"),
+            Layout(name="footer", size=3),
+        )
+        layout["body"].split_row(
+            Layout(name="artists", ratio=1),
+            Layout(name="songs", ratio=1),
+            Layout(name="details", ratio=1),
+        )
+        return layout
+
+    def render(self):
+        self.layout["header"].update(
+            Panel(Text(self.status_message, style="bold"), border_style="green")
+        )
+        self.layout["artists"].update(self.artist_view.render())
+        self.layout["songs"].update(self.song_view.render())
+        self.layout["details"].update(self.details_view.render())
+        self.layout["footer"].update(self.controls.render())
+        return self.layout
+
+    # ------------------------------------------------------------------
+    # Actions
+    # ------------------------------------------------------------------
+
+    def toggle_play_pause(self):
+        if not self.player.current_track:
+            self.play_selected()
+            return
+        self.player.toggle_play_pause()
+        self.status_message = (
+            "Paused" if self.player.is_paused else "Playing"
+        )
+        self._dirty = True
+
+    def play_selected(self):
+        song = self.song_view.selected_song
+        if song is None:
+            if not self.player.playlist:
+                self.player.load_from_directory()
+            if self.player.playlist and self.player.load(
+                self.player.playlist[self.player.current_playlist_index]
+            ):
+                self.player.play()
+            return
+        self.player.set_playlist(
+            [t.path for t in self.song_view.songs],
+            start_index=self.song_view.selected_index,
+        )
+        if self.player.load(song.path):
+            self.player.play()
+            self.status_message = f"Playing: {song.title}"
+        else:
+            self.status_message = f"Could not play: {song.title}"
+        self._dirty = True
+
+    def next_track(self):
+        if self.player.next_track():
+            self.status_message = "Next track"
+            self._dirty = True
+
+    def previous_track(self):
+        if self.player.previous_track():
+            self.status_message = "Previous track"
+            self._dirty = True
+
+    def _selection_moved(self, step):
+        """Move the active pane's selection; report whether it changed.
+
+        The status line (and the render it forces) only updates on a real
+        change, so a held arrow key at a list edge produces no work.
+        """
+        if self.active_pane == "artists":
+            before = self.artist_view.selected_artist
+            if step > 0:
+                self.artist_view.select_next()
+            else:
+                self.artist_view.select_previous()
+            artist = self.artist_view.selected_artist
+            if artist == before:
+                return False
+            self.song_view.update_songs(artist)
+            self.status_message = "Selected artist: " + (artist or "")
+            return True
+        before = self.song_view.selected_index
+        if step > 0:
+            self.song_view.select_next()
+        else:
+            self.song_view.select_previous()
+        song = self.song_view.selected_song
+        if song is None or self.song_view.selected_index == before:
+            return False
+        self.status_message = "Selected song: " + song.title
+        return True
+
+    def select_next(self):
+        if self._selection_moved(1):
+            self._dirty = True
+
+    def select_previous(self):
+        if self._selection_moved(-1):
+            self._dirty = True
+
+    def switch_pane(self):
+        self.active_pane = "songs" if self.active_pane == "artists" else "artists"
+        self.status_message = f"Pane: {self.active_pane}"
+        self._dirty = True
+
+    def handle_key(self, code):
+        if code == KEY_QUIT:
+            self.running = False
+        elif code == KEY_SPACE:
+            self.toggle_play_pause()
+        elif code == KEY_NEXT:
+            self.next_track()
+        elif code == KEY_PREV:
+            self.previous_track()
+        elif code == KEY_UP:
+            self.select_previous()
+        elif code == KEY_DOWN:
+            self.select_next()
+        elif code == KEY_TAB:
+            self.switch_pane()
+        elif code == KEY_ENTER or code == KEY_ENTER_CR:
+            self.play_selected()
+        elif code == KEY_VOL_UP:
+            self.player.volume_up()
+            self.status_message = f"Volume: {int(self.player.volume * 100)}%"
+            self._dirty = True
+        elif code == KEY_VOL_DOWN:
+            self.player.volume_down()
+            self.status_message = f"Volume: {int(self.player.volume * 100)}%"
+            self._dirty = True
+
+    # ------------------------------------------------------------------
+    # Main loop
+    # ------------------------------------------------------------------
+
+    def _poll_timeout(self):
+        """How long the loop may sleep before the display could change.
+
+        While playing, the next visible change is at most one second away
+        (the position clock), and for short tracks one percent of the bar
+        comes sooner still. Paused or idle, nothing on screen moves at
+        all — block until a keypress arrives and the loop costs zero CPU.
+        """
+        if self.player.is_playing and not self.player.is_paused:
+            if self.player.duration:
+                return min(0.25, max(0.05, self.player.duration / 100))
+            return 0.25
+        return None
+
+    def run(self):
+        self.running = True
+        fd = sys.stdin.fileno()
+        old_settings = termios.tcgetattr(fd)
+        selector = selectors.DefaultSelector()
+        selector.register(sys.stdin, selectors.EVENT_READ)
+        try:
+            tty.setcbreak(fd)
+            with Live(
+                self.render(),
+                console=self.console,
+                refresh_per_second=4,
+                auto_refresh=False,
+                screen=True,
+            ) as live:
+                # Cap flushes at 60 Hz: a pending dirty frame waits out
+                # the remainder of the frame budget instead of letting a
+                # tight input loop flood stdout with renders.
+                min_frame = 1 / 60
+                last_flush = 0.0
+                while self.running:
+                    timeout = self._poll_timeout()
+                    if self._dirty:
+                        wait = max(0.0, last_flush + min_frame - time.monotonic())
+                        timeout = wait if timeout is None else min(timeout, wait)
+                    events = selector.select(timeout=timeout)
+                    if events:
+                        # Drain everything pending (held keys, pasted
+                        # input) and render once for the whole burst.
+                        data = os.read(fd, 64)
+                        for code in _parse_keys(data):
+                            self.handle_key(code)
+                    # The screen shows whole percent (progress bar) and
+                    # whole seconds (position clock); a playing track
+                    # dirties the frame when either visible unit ticks.
+                    if self.player.is_playing and not self.player.is_paused:
+                        progress = int(self.player.get_progress_percentage())
+                        second = int(self.player.position)
+                        if (
+                            progress != self._last_progress
+                            or second != self._last_second
+                        ):
+                            self._last_progress = progress
+                            self._last_second = second
+                            self._dirty = True
+                    now = time.monotonic()
+                    if self._dirty and now - last_flush >= min_frame:
+                        self._dirty = False
+                        last_flush = now
+                        live.update(self.render(), refresh=True)
+        finally:
+            selector.close()
+            termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+            self.player.stop()
+            self.library.flush()
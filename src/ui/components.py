@@ -0,0 +1,287 @@
+"""Rich view components for the main screen."""
+
+import os
+
+from rich.align import Align
+from rich.box import ROUNDED
+from rich.panel import Panel
+from rich.table import Table
+from rich.text import Text
+
+try:
+    from mutagen.id3 import ID3
+    from mutagen.mp3 import MP3
+
+    _MUTAGEN = True
+except ImportError:
+    _MUTAGEN = False
+
+from src.utils.helpers import format_duration
+
+
+def _visible_window(total, selected, height, overhead=4):
+    """Row range [start, end) that fits on screen, centered on `selected`.
+
+    `overhead` accounts for the panel border and table padding.
+    """
+    rows = max(1, height - overhead)
+    start = max(0, selected - rows // 2)
+    end = min(total, start + rows)
+    start = max(0, end - rows)
+    return start, end
+
+
+class ArtistView:
+    """Left column: the list of artists in the library."""
+
+    def __init__(self, library, height=30, width=40):
+        self.library = library
+        self.artists = []
+        self.selected_name = None  # selection keyed by artist, not index
+        self.selected_index = 0  # derived from selected_name per refresh
+        self.height = height  # rows the containing panel can show
+        self._cached_panel = None
+        self._cached_selected_index = -1
+        self._cached_lib_version = -1
+        # The layout is fixed, so columns get explicit widths and
+        # expand=False — Rich then skips its measure pass per render.
+        self._col_width = max(10, width - 8)
+        self._table_kwargs = dict(
+            expand=False, box=ROUNDED, padding=(0, 1, 0, 1), show_header=False
+        )
+        self._panel_kwargs = dict(title="Artists", border_style="cyan")
+
+    def update_artists(self):
+        if self.artists and self.library.version == self._cached_lib_version:
+            return
+        self.artists = self.library.get_artists()
+        # Re-anchor on the selected name: inserts and deletes elsewhere in
+        # the list must not silently move the selection to another artist.
+        if self.selected_name is not None and self.selected_name in self.artists:
+            self.selected_index = self.artists.index(self.selected_name)
+        else:
+            self.selected_index = min(
+                self.selected_index, max(0, len(self.artists) - 1)
+            )
+            self.selected_name = (
+                self.artists[self.selected_index] if self.artists else None
+            )
+
+    @property
+    def selected_artist(self):
+        return self.selected_name
+
+    def _move_selection(self, step):
+        self.update_artists()
+        if not self.artists:
+            return
+        self.selected_index = (self.selected_index + step) % len(self.artists)
+        self.selected_name = self.artists[self.selected_index]
+
+    def select_next(self):
+        self._move_selection(1)
+
+    def select_previous(self):
+        self._move_selection(-1)
+
+    def render(self):
+        # The panel only changes when the library or the selection does;
+        # otherwise return the same renderable by reference.
+        if (
+            self._cached_panel is not None
+            and self._cached_lib_version == self.library.version
+            and self._cached_selected_index == self.selected_index
+        ):
+            return self._cached_panel
+        self.update_artists()
+        table = Table(**self._table_kwargs)
+        table.add_column("Artist", width=self._col_width)
+        start, end = _visible_window(
+            len(self.artists), self.selected_index, self.height
+        )
+        for i in range(start, end):
+            artist = self.artists[i]
+            if i == self.selected_index:
+                table.add_row(Text(f"> {artist}", style="bold reverse"))
+            else:
+                table.add_row(Text(f"  {artist}"))
+        self._cached_panel = Panel(table, **self._panel_kwargs)
+        self._cached_selected_index = self.selected_index
+        self._cached_lib_version = self.library.version
+        return self._cached_panel
+
+
+class SongView:
+    """Middle column: songs for the selected artist."""
+
+    def __init__(self, library, player, height=30, width=40):
+        self.library = library
+        self.player = player
+        self.songs = []
+        self.selected_index = 0
+        self.height = height  # rows the containing panel can show
+        self._title_width = max(10, width - 16)
+        self._length_width = 6
+        self._table_kwargs = dict(
+            expand=False, box=ROUNDED, padding=(0, 1, 0, 1), show_header=False
+        )
+        self._panel_kwargs = dict(title="Songs", border_style="cyan")
+
+    def update_songs(self, artist=None):
+        if artist is not None:
+            self.songs = self.library.get_tracks_for_artist(artist)
+        else:
+            self.songs = self.library.get_all_sorted()
+        if self.selected_index >= len(self.songs):
+            self.selected_index = max(0, len(self.songs) - 1)
+
+    @property
+    def selected_song(self):
+        if self.songs and 0 <= self.selected_index < len(self.songs):
+            return self.songs[self.selected_index]
+        return None
+
+    def select_next(self):
+        if self.songs:
+            self.selected_index = (self.selected_index + 1) % len(self.songs)
+
+    def select_previous(self):
+        if self.songs:
+            self.selected_index = (self.selected_index - 1) % len(self.songs)
+
+    def render(self):
+        table = Table(**self._table_kwargs)
+        table.add_column("Title", width=self._title_width)
+        table.add_column("Length", justify="right", width=self._length_width)
+        current_basename = (
+            os.path.basename(self.player.current_track)
+            if self.player.current_track
+            else None
+        )
+        start, end = _visible_window(
+            len(self.songs), self.selected_index, self.height
+        )
+        for i in range(start, end):
+            track = self.songs[i]
+            playing = track._basename == current_basename
+            marker = "♪ " if playing else "  "
+            style = "bold green" if playing else ""
+            if i == self.selected_index:
+                style = "bold reverse"
+            table.add_row(
+                Text(f"{marker}{track.title}", style=style),
+                Text(track.formatted_duration, style=style),
+            )
+        return Panel(table, **self._panel_kwargs)
+
+
+class DetailsView:
+    """Right column: technical details and progress for the current track."""
+
+    def __init__(self, player):
+        self.player = player
+        self._meta_cache_path = None
+        self._meta_cache = None
+        self._panel_kwargs = dict(title="Details", border_style="cyan")
+
+    def _get_details(self, track):
+        """Parse format/tag details once per track, not once per frame."""
+        if track == self._meta_cache_path:
+            return self._meta_cache
+        details = None
+        if not _MUTAGEN:
+            self._meta_cache_path = track
+            self._meta_cache = None
+            return None
+        try:
+            audio = MP3(track)
+            details = {
+                "format": "MP3",
+                "bitrate": int(audio.info.bitrate / 1000),
+                "sample_rate": audio.info.sample_rate,
+                "channels": audio.info.channels,
+            }
+            tags = ID3(track)
+            if tags.get("TALB"):
+                details["album"] = str(tags["TALB"])
+            if tags.get("TDRC"):
+                details["year"] = str(tags["TDRC"])
+            if tags.get("TCON"):
+                details["genre"] = str(tags["TCON"])
+            details["has_art"] = any(k.startswith("APIC") for k in tags.keys())
+        except Exception:
+            details = None
+        self._meta_cache_path = track
+        self._meta_cache = details
+        return details
+
+    def render(self):
+        text = Text()
+        track = self.player.current_track
+        if track:
+            details = self._get_details(track)
+            if details is not None:
+                text.append(f"Format: {details['format']}\n")
+                text.append(f"Bitrate: {details['bitrate']} kbps\n")
+                text.append(f"Sample rate: {details['sample_rate']} Hz\n")
+                text.append(f"Channels: {details['channels']}\n")
+                if "album" in details:
+                    text.append(f"Album: {details['album']}\n")
+                if "year" in details:
+                    text.append(f"Year: {details['year']}\n")
+                if "genre" in details:
+                    text.append(f"Genre: {details['genre']}\n")
+                text.append(
+                    f"Album art: {'yes' if details['has_art'] else 'no'}\n"
+                )
+            else:
+                text.append("No details available\n", style="dim")
+            percentage = self.player.get_progress_percentage()
+            filled = int(percentage / 100 * 30)
+            bar = "█" * filled + "░" * (30 - filled)
+            text.append(f"\n{bar}\n", style="green")
+            text.append(self.player.get_formatted_position(), style="dim")
+        else:
+            text.append("Nothing playing", style="dim")
+        return Panel(text, **self._panel_kwargs)
+
+
+class PlayerControls:
+    """Bottom bar: transport state and key help."""
+
+    def __init__(self, player):
+        self.player = player
+        # The bar differs only by the play/pause glyph, so both variants
+        # are built once here and render() returns one by reference.
+        self._panel_playing = self._build_panel("⏸")
+        self._panel_paused = self._build_panel("▶")
+
+    @staticmethod
+    def _build_panel(glyph):
+        text = Text()
+        text.append(f" {glyph} ", style="bold green")
+        text.append("space", style="bold")
+        text.append(" play/pause  ")
+        text.append("n", style="bold")
+        text.append(" next  ")
+        text.append("b", style="bold")
+        text.append(" previous  ")
+        text.append("↑/↓", style="bold")
+        text.append(" navigate  ")
+        text.append("tab", style="bold")
+        text.append(" switch pane  ")
+        text.append("+/-", style="bold")
+        text.append(" volume  ")
+        text.append("q", style="bold")
+        text.append(" quit")
+        return Panel(
+            Align.center(text),
+            title="Controls",
+            subtitle="t3rm1n4l",
+            border_style="green",
+        )
+
+    def render(self):
+        if self.player.is_playing and not self.player.is_paused:
+            return self._panel_playing
+        return self._panel_paused
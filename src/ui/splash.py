@@ -0,0 +1,73 @@
+"""Startup splash screen."""
+
+import sys
+import time
+
+T3RM1N4L_ASCII = r"""
+ _____ _____ ____  __  __ _ _   _ _  _   _
+|_   _|___ /|  _ \|  \/  / | \ | | || | | |
+  | |   |_ \| |_) | |\/| | |  \| | || |_| |
+  | |  ___) |  _ <| |  | | | |\  |__   _| |___
+  |_| |____/|_| \_\_|  |_|_|_| \_|  |_| |_____|
+
+          play music from the terminal
+"""
+
+_SPINNER_FRAMES = ("|", "/", "-", "\\")
+
+_GREEN = "\x1b[32m"
+_DIM = "\x1b[2m"
+_RESET = "\x1b[0m"
+
+
+def _build_frame():
+    """Render the bordered banner once as bytes, plus the spinner position.
+
+    Returns (frame_bytes, spinner_row, spinner_col), rows/cols 1-based for
+    cursor-positioning escapes.
+    """
+    art = T3RM1N4L_ASCII.strip("\n").split("\n")
+    width = max(len(line) for line in art)
+    lines = [_GREEN + "┌" + "─" * (width + 4) + "┐" + _RESET]
+    for line in art:
+        lines.append(_GREEN + "│  " + line.ljust(width) + "  │" + _RESET)
+    spinner_prefix = "loading "
+    lines.append(
+        _GREEN + "│  " + _DIM + spinner_prefix + "|" + _RESET
+        + _GREEN + " " * (width - len(spinner_prefix) - 1) + "  │" + _RESET
+    )
+    lines.append(_GREEN + "└" + "─" * (width + 4) + "┘" + _RESET)
+    frame = "\x1b[2J\x1b[H\x1b[?25l" + "\n".join(lines)
+    spinner_row = len(lines) - 1  # the line before the bottom border
+    spinner_col = 4 + len(spinner_prefix)  # border, two spaces, prefix
+    return frame.encode(), spinner_row, spinner_col
+
+
+_FRAME_BYTES, _SPINNER_ROW, _SPINNER_COL = _build_frame()
+
+
+def loading_animation(duration=3.0):
+    """Show the ASCII banner with a spinner for `duration` seconds.
+
+    The bordered banner is precomputed as one ANSI bytes buffer and
+    written once; each frame then repositions the cursor and rewrites the
+    single spinner cell, bypassing any per-frame layout work.
+    """
+    out = sys.stdout.buffer
+    out.write(_FRAME_BYTES)
+    out.flush()
+    move = f"\x1b[{_SPINNER_ROW};{_SPINNER_COL}H".encode()
+    end = time.time() + duration
+    i = 0
+    while time.time() < end:
+        spinner = _SPINNER_FRAMES[i % len(_SPINNER_FRAMES)]
+        out.write(move + _DIM.encode() + spinner.encode() + _RESET.encode())
+        out.flush()
+        time.sleep(0.1)
+        i += 1
+    out.write(b"\x1b[2J\x1b[H\x1b[?25h")
+    out.flush()
+
+
+def show_splash_screen(duration=3.0):
+    loading_animation(duration)
@@ -0,0 +1,64 @@
+"""Small shared helpers for t3rm1n4l."""
+
+import functools
+import os
+import re
+
+# "01 - Artist - Title", "Artist - Title", "01 - Title" or bare "Title".
+# The separator needs surrounding spaces so hyphenated words stay intact.
+_TRACK_NAME_PAT = re.compile(r"^(?:\d+\s+-\s+)?(?:([^-]+?)\s+-\s+)?(.+)$")
+
+
+def format_duration(seconds):
+    """Format a duration in seconds as M:SS."""
+    minutes, secs = divmod(int(seconds), 60)
+    return f"{minutes}:{secs:02d}"
+
+
+@functools.lru_cache(maxsize=1)
+def find_music_directory():
+    """Locate the bundled music/ directory relative to the project root.
+
+    The project layout is fixed for the life of the process, so the
+    result is memoized and the path probing runs once.
+    """
+    project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    music_dir = os.path.join(project_root, "music")
+    if os.path.exists(music_dir):
+        return music_dir
+    return os.path.join(os.getcwd(), "music")
+
+
+def iter_music_files(root, exts=(".mp3", ".wav", ".ogg", ".flac")):
+    """Yield (path, mtime) for every audio file under `root`.
+
+    Iterative os.scandir walk: the dirent read supplies both the type and
+    the stat result, so matches cost no extra syscalls and the mtime comes
+    for free for callers that skip unchanged files on rescan.
+    """
+    stack = [root]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file(
+                    follow_symlinks=False
+                ) and entry.name.lower().endswith(exts):
+                    yield entry.path, entry.stat(follow_symlinks=False).st_mtime
+
+
+def extract_track_info_from_filename(filename):
+    """Guess artist/title from a filename like '01 - Artist - Title.mp3'."""
+    name = os.path.splitext(filename)[0]
+    m = _TRACK_NAME_PAT.match(name)
+    if m is None:
+        return {"artist": "Unknown Artist", "title": name.strip()}
+    return {
+        "artist": (m.group(1) or "Unknown Artist").strip(),
+        "title": m.group(2).strip(),
+    }